@@ -9,7 +9,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from .data_loader import get_column_summary, load_data
+from .cube import CUBE_AGGREGATIONS, apply_filters, dataset_fingerprint, get_cube
+from .data_loader import format_memory_report, get_column_summary, load_data, optimize_dtypes
 from .llm_client import analyze_and_propose_visualizations, get_client
 from .visualizations import create_chart, figure_to_png_bytes
 
@@ -113,11 +114,11 @@ def main() -> None:
 
         if dataset_source == "CSV (fichier)":
             uploaded = st.file_uploader("Choisir un fichier CSV", type=["csv"])
-            if uploaded:
-                df = pd.read_csv(uploaded)
-                st.session_state["dataset_df"] = df
-            else:
-                df = st.session_state.get("dataset_df")
+            # Relecture et optimisation uniquement lorsque le fichier change
+            if uploaded and st.session_state.get("uploaded_file_id") != uploaded.file_id:
+                st.session_state["dataset_df"] = optimize_dtypes(pd.read_csv(uploaded))
+                st.session_state["uploaded_file_id"] = uploaded.file_id
+            df = st.session_state.get("dataset_df")
         else:
             dataset_id = st.text_input(
                 "ID du dataset Hugging Face",
@@ -153,6 +154,9 @@ def main() -> None:
     # Aperçu des données
     with st.expander("Aperçu des données"):
         st.dataframe(df.head(20), use_container_width=True)
+        memory_report = format_memory_report(df)
+        if memory_report:
+            st.caption(memory_report)
 
     # Bouton pour générer les propositions
     if st.button("🚀 Générer les propositions de visualisation", type="primary"):
@@ -180,6 +184,7 @@ def main() -> None:
                 proposals = result.get("proposals", [])
                 st.session_state["proposals"] = proposals
                 st.session_state["df"] = df
+                st.session_state.pop("df_fingerprint", None)
             except Exception as e:
                 st.error(f"Erreur lors de l'appel au LLM : {e}")
                 raise
@@ -234,10 +239,42 @@ def main() -> None:
             st.subheader("📈 Visualisation finale")
 
             try:
+                # Exploration : filtres et agrégation servis par le cube pré-calculé
+                if "df_fingerprint" not in st.session_state:
+                    st.session_state["df_fingerprint"] = dataset_fingerprint(df)
+                cube = get_cube(df, selected, st.session_state["df_fingerprint"])
+                config = selected
+                data = None
+                if cube is not None:
+                    index = st.session_state.get("selected_index", 0)
+                    aggregations = [a for a in CUBE_AGGREGATIONS if cube.supports(a)]
+                    current = selected.get("aggregation", "mean")
+                    if current not in aggregations:
+                        aggregations.insert(0, current)
+                    filter_cols = st.columns(len(cube.dimensions) + 1)
+                    aggregation = filter_cols[0].selectbox(
+                        "Agrégation",
+                        aggregations,
+                        index=aggregations.index(current),
+                        key=f"agg_{index}",
+                    )
+                    filters = {
+                        col: filter_cols[j + 1].multiselect(
+                            col, cube.values(col), key=f"filter_{index}_{col}"
+                        )
+                        for j, col in enumerate(cube.dimensions)
+                    }
+                    config = {**selected, "aggregation": aggregation}
+                    if cube.supports(aggregation):
+                        data = cube.query(aggregation, filters)
+                    else:
+                        df = apply_filters(df, filters)
+
                 fig = create_chart(
                     df,
-                    selected,
+                    config,
                     title=selected.get("title", "Visualisation"),
+                    data=data,
                 )
                 st.plotly_chart(fig, use_container_width=True)
 
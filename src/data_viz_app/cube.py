@@ -0,0 +1,209 @@
+"""Cubes OLAP pré-agrégés pour l'exploration interactive d'une visualisation."""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import pandas as pd
+
+# Agrégations reconstituables à partir des statistiques stockées dans le cube
+CUBE_AGGREGATIONS = ("sum", "mean", "count", "min", "max")
+
+# Types de graphiques tracés à partir des données brutes (non servis par le cube)
+RAW_CHART_TYPES = {"scatter", "pie", "histogram", "box"}
+
+# Au-delà, une colonne de filtre proposée par le LLM est ignorée (cube trop gros)
+MAX_FILTER_CARDINALITY = 50
+
+# Au-delà de max(MIN_CUBE_CELLS, MAX_CUBE_RATIO × lignes) combinaisons x × group_by,
+# le cube n'apporte aucun gain (ex: x continu) et le graphique reste sur les données brutes
+MAX_CUBE_RATIO = 0.2
+MIN_CUBE_CELLS = 1000
+
+MAX_CACHED_CUBES = 16
+
+# Noms réservés des statistiques, distincts des colonnes du dataset (ex: "size")
+STAT_COLUMNS = {
+    "size": "__size",
+    "sum": "__sum",
+    "count": "__count",
+    "min": "__min",
+    "max": "__max",
+}
+
+_CUBE_CACHE: "OrderedDict[tuple, Optional[DataCube]]" = OrderedDict()
+
+# Le cache est partagé par les sessions Streamlit (threads distincts)
+_CUBE_CACHE_LOCK = threading.Lock()
+
+
+@dataclass
+class DataCube:
+    """Agrégats (size, sum, count, min, max) de y_column par x × group_by × filtres."""
+
+    x_column: str
+    y_column: str
+    group_by: Optional[str]
+    filter_columns: list[str]
+    cells: pd.DataFrame
+
+    @property
+    def dimensions(self) -> list[str]:
+        """Colonnes de filtre disponibles (group_by puis filtres suggérés)."""
+        return ([self.group_by] if self.group_by else []) + self.filter_columns
+
+    def values(self, column: str) -> list[Any]:
+        """Valeurs distinctes d'une dimension du cube, pour les widgets de filtre."""
+        return sorted(self.cells[column].dropna().unique().tolist(), key=str)
+
+    def supports(self, aggregation: str) -> bool:
+        """Indique si l'agrégation peut être calculée depuis le cube."""
+        if aggregation not in CUBE_AGGREGATIONS:
+            return False
+        return aggregation == "count" or STAT_COLUMNS["sum"] in self.cells.columns
+
+    def query(
+        self,
+        aggregation: str,
+        filters: Optional[dict[str, list[Any]]] = None,
+    ) -> pd.DataFrame:
+        """
+        Répond à une agrégation filtrée sans repasser par les données brutes.
+
+        Le résultat a le même format que visualizations._prepare_data.
+        """
+        if not self.supports(aggregation):
+            raise ValueError(f"Agrégation non supportée par le cube : {aggregation}")
+
+        cells = self.cells
+        for column, selected in (filters or {}).items():
+            if column not in self.dimensions:
+                raise ValueError(f"Colonne de filtre '{column}' absente du cube")
+            if selected:
+                cells = cells[cells[column].isin(selected)]
+
+        keys = [self.x_column] + ([self.group_by] if self.group_by else [])
+        grouped = cells.groupby(keys, observed=True)
+        if aggregation == "count":
+            result = grouped[STAT_COLUMNS["size"]].sum()
+        elif aggregation == "sum":
+            result = grouped[STAT_COLUMNS["sum"]].sum()
+        elif aggregation == "mean":
+            result = grouped[STAT_COLUMNS["sum"]].sum() / grouped[STAT_COLUMNS["count"]].sum()
+        elif aggregation == "min":
+            result = grouped[STAT_COLUMNS["min"]].min()
+        else:
+            result = grouped[STAT_COLUMNS["max"]].max()
+        return result.rename(self.y_column or "count").reset_index()
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """Empreinte du contenu d'un DataFrame (colonnes, types et valeurs)."""
+    digest = hashlib.sha1()
+    digest.update(repr(list(zip(df.columns, map(str, df.dtypes)))).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+def _valid_filter_columns(
+    df: pd.DataFrame,
+    candidates: Optional[list[str]],
+    exclude: list[str],
+) -> list[str]:
+    """Garde les colonnes de filtre existantes et de faible cardinalité."""
+    columns = []
+    for col in candidates or []:
+        if col in df.columns and col not in exclude and col not in columns:
+            if df[col].nunique() <= MAX_FILTER_CARDINALITY:
+                columns.append(col)
+    return columns
+
+
+def _cube_too_large(df: pd.DataFrame, x_column: str, group_by: Optional[str]) -> bool:
+    """Estime le nombre de combinaisons x × group_by et le compare à la limite."""
+    cells = df[x_column].nunique(dropna=False)
+    if group_by:
+        cells *= df[group_by].nunique(dropna=False)
+    return cells > max(MIN_CUBE_CELLS, MAX_CUBE_RATIO * len(df))
+
+
+def build_cube(
+    df: pd.DataFrame,
+    x_column: str,
+    y_column: str,
+    group_by: Optional[str] = None,
+    filter_columns: Optional[list[str]] = None,
+) -> DataCube:
+    """Pré-calcule les agrégats de y_column sur x × group_by × filtres."""
+    for label, col in (("X", x_column), ("Y", y_column), ("group_by", group_by)):
+        if col and col not in df.columns:
+            raise ValueError(f"Colonne {label} '{col}' absente du dataset")
+
+    filters = _valid_filter_columns(df, filter_columns, [x_column, group_by])
+    dims = [x_column] + ([group_by] if group_by else []) + filters
+
+    grouped = df.groupby(dims, observed=True, dropna=False)
+    if pd.api.types.is_numeric_dtype(df[y_column]) and not pd.api.types.is_bool_dtype(df[y_column]):
+        cells = grouped[y_column].agg(list(STAT_COLUMNS)).rename(columns=STAT_COLUMNS)
+    else:
+        cells = grouped.size().rename(STAT_COLUMNS["size"]).to_frame()
+    return DataCube(x_column, y_column, group_by, filters, cells.reset_index())
+
+
+def get_cube(
+    df: pd.DataFrame,
+    config: dict[str, Any],
+    fingerprint: Optional[str] = None,
+) -> Optional[DataCube]:
+    """
+    Retourne le cube d'une proposition, mis en cache par empreinte du dataset.
+
+    Retourne None si le type de graphique est tracé depuis les données brutes
+    ou si le cube serait trop gros par rapport au dataset.
+    """
+    chart_type = config.get("chart_type", "bar").lower()
+    if chart_type in RAW_CHART_TYPES:
+        return None
+    group_by = config.get("group_by") or None
+    if group_by == "null":
+        group_by = None
+    x_column = config.get("x_column", "")
+    y_column = config.get("y_column", "")
+    filter_columns = config.get("filter_columns") or []
+    if isinstance(filter_columns, str):
+        filter_columns = [filter_columns]
+    filter_columns = list(filter_columns)
+
+    key = (
+        fingerprint or dataset_fingerprint(df),
+        x_column,
+        y_column,
+        group_by,
+        tuple(filter_columns),
+    )
+    with _CUBE_CACHE_LOCK:
+        if key in _CUBE_CACHE:
+            _CUBE_CACHE.move_to_end(key)
+            return _CUBE_CACHE[key]
+
+    # Colonnes absentes : build_cube lève l'erreur explicite habituelle
+    dims_present = all(col in df.columns for col in (x_column, group_by) if col)
+    cube = None
+    if not dims_present or not _cube_too_large(df, x_column, group_by):
+        cube = build_cube(df, x_column, y_column, group_by, filter_columns)
+    with _CUBE_CACHE_LOCK:
+        _CUBE_CACHE[key] = cube
+        _CUBE_CACHE.move_to_end(key)
+        while len(_CUBE_CACHE) > MAX_CACHED_CUBES:
+            _CUBE_CACHE.popitem(last=False)
+    return cube
+
+
+def apply_filters(df: pd.DataFrame, filters: dict[str, list[Any]]) -> pd.DataFrame:
+    """Filtre les données brutes (graphiques non servis par le cube)."""
+    for column, selected in filters.items():
+        if selected:
+            df = df[df[column].isin(selected)]
+    return df
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -11,13 +12,23 @@ try:
 except ImportError:
     HAS_DATASETS = False
 
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# Ratio valeurs uniques / valeurs non nulles en dessous duquel une colonne texte
+# est convertie en "category" (ex: track_genre) plutôt qu'en chaîne Arrow (ex: Name)
+CATEGORY_RATIO = 0.5
+
 
 def load_csv(file_path: str | Path) -> pd.DataFrame:
     """Charge un fichier CSV et retourne un DataFrame."""
     path = Path(file_path)
     if not path.exists():
         raise FileNotFoundError(f"Fichier non trouvé : {path}")
-    return pd.read_csv(path)
+    return optimize_dtypes(pd.read_csv(path))
 
 
 def load_huggingface_dataset(dataset_id: str, split: str = "train") -> pd.DataFrame:
@@ -30,7 +41,70 @@ def load_huggingface_dataset(dataset_id: str, split: str = "train") -> pd.DataFr
             "La librairie 'datasets' est requise. Installez avec: pip install datasets"
         )
     ds = load_dataset(dataset_id, split=split)
-    return ds.to_pandas()
+    return optimize_dtypes(ds.to_pandas())
+
+
+def _optimize_column(series: pd.Series, category_ratio: float) -> pd.Series:
+    """Retourne la colonne convertie dans le type le plus compact possible."""
+    if pd.api.types.is_bool_dtype(series):
+        return series
+    if pd.api.types.is_integer_dtype(series) and series.dtype.kind in "iu":
+        return pd.to_numeric(series, downcast="integer" if series.dtype.kind == "i" else "unsigned")
+    if pd.api.types.is_float_dtype(series) and series.dtype.kind == "f":
+        # float32 uniquement si toutes les valeurs sont conservées à l'identique
+        downcast = series.astype("float32")
+        if np.array_equal(downcast.astype(series.dtype), series, equal_nan=True):
+            return downcast
+        return series
+    is_string = isinstance(series.dtype, pd.StringDtype)
+    if series.dtype != object and not is_string:
+        return series
+
+    non_null = series.dropna()
+    if non_null.empty:
+        return series
+    if not is_string:
+        if non_null.map(type).eq(bool).all():
+            return series.astype("boolean") if series.isna().any() else series.astype(bool)
+        if not non_null.map(type).eq(str).all():
+            return series
+    if non_null.nunique() <= category_ratio * len(non_null):
+        return series.astype("category")
+    if HAS_PYARROW and not (is_string and series.dtype.storage == "pyarrow"):
+        return series.astype(pd.StringDtype("pyarrow"))
+    return series
+
+
+def optimize_dtypes(df: pd.DataFrame, category_ratio: float = CATEGORY_RATIO) -> pd.DataFrame:
+    """
+    Convertit les colonnes dans des types compacts pour réduire la mémoire.
+
+    - texte très répété -> category, autre texte -> chaîne Arrow (si pyarrow)
+    - entiers / flottants -> plus petit type numérique suffisant
+    - objets booléens -> bool (ou boolean si valeurs manquantes)
+
+    L'empreinte mémoire avant/après est stockée dans df.attrs["memory_report"].
+    """
+    before = int(df.memory_usage(deep=True).sum())
+    result = df.apply(_optimize_column, category_ratio=category_ratio)
+    result.attrs["memory_report"] = {
+        "before": before,
+        "after": int(result.memory_usage(deep=True).sum()),
+    }
+    return result
+
+
+def format_memory_report(df: pd.DataFrame) -> Optional[str]:
+    """Résume le gain mémoire de optimize_dtypes, ou None si non optimisé."""
+    report = df.attrs.get("memory_report")
+    if not report:
+        return None
+    before, after = report["before"], report["after"]
+    gain = 100 * (1 - after / before) if before else 0.0
+    return (
+        f"Mémoire : {before / 1024**2:.2f} Mo → {after / 1024**2:.2f} Mo "
+        f"({gain:.0f} % économisés)"
+    )
 
 
 def load_data(
@@ -45,6 +45,7 @@ Chaque proposition doit :
 2. Respecter les bonnes pratiques ci-dessus
 3. Utiliser les colonnes disponibles dans le dataset
 4. Être justifiée (pourquoi ce type de graphique, quelles colonnes, quel message)
+5. Suggérer des colonnes catégorielles (peu de valeurs distinctes) pour filtrer et explorer le graphique
 
 Format de réponse strictement JSON :
 {{
@@ -56,6 +57,7 @@ Format de réponse strictement JSON :
       "y_column": "nom_colonne",
       "group_by": "nom_colonne ou null",
       "aggregation": "sum|mean|count|none",
+      "filter_columns": ["colonnes catégorielles utiles pour filtrer (0 à 3)"],
       "justification": "Explication détaillée de 2-3 phrases"
     }},
     ...
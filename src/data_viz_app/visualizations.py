@@ -27,20 +27,20 @@ def _prepare_data(
     if group_by:
         agg_func = aggregation if aggregation != "none" else "first"
         if aggregation == "count":
-            result = df.groupby([x_column, group_by]).size().reset_index(name=y_column or "count")
+            result = df.groupby([x_column, group_by], observed=True).size().reset_index(name=y_column or "count")
         else:
             result = (
-                df.groupby([x_column, group_by])[y_column]
+                df.groupby([x_column, group_by], observed=True)[y_column]
                 .agg(agg_func)
                 .reset_index()
             )
         return result
 
     if aggregation == "count":
-        result = df.groupby(x_column).size().reset_index(name=y_column or "count")
+        result = df.groupby(x_column, observed=True).size().reset_index(name=y_column or "count")
         return result
     if aggregation != "none":
-        result = df.groupby(x_column)[y_column].agg(aggregation).reset_index()
+        result = df.groupby(x_column, observed=True)[y_column].agg(aggregation).reset_index()
         return result
 
     return df[[x_column, y_column]].copy()
@@ -50,6 +50,7 @@ def create_chart(
     df: pd.DataFrame,
     config: dict[str, Any],
     title: str = "Visualisation",
+    data: Optional[pd.DataFrame] = None,
 ) -> go.Figure:
     """
     Crée un graphique Plotly selon la configuration LLM.
@@ -58,6 +59,7 @@ def create_chart(
         df: DataFrame des données
         config: Dictionnaire avec chart_type, x_column, y_column, group_by, aggregation
         title: Titre du graphique
+        data: Données déjà agrégées (ex: requête sur un cube), remplace _prepare_data
     """
     chart_type = config.get("chart_type", "bar").lower()
     x_column = config.get("x_column", "")
@@ -67,7 +69,8 @@ def create_chart(
         group_by = None
     aggregation = config.get("aggregation", "mean")
 
-    data = _prepare_data(df, x_column, y_column, group_by, aggregation)
+    if data is None:
+        data = _prepare_data(df, x_column, y_column, group_by, aggregation)
 
     fig: go.Figure
 
@@ -91,7 +94,7 @@ def create_chart(
         dim = group_by or x_column
         if dim not in df.columns or y_column not in df.columns:
             raise ValueError(f"Colonnes {dim} ou {y_column} absentes")
-        pie_data = df.groupby(dim)[y_column].sum().reset_index()
+        pie_data = df.groupby(dim, observed=True)[y_column].sum().reset_index()
         fig = px.pie(pie_data, names=dim, values=y_column)
     elif chart_type == "histogram":
         fig = px.histogram(df, x=x_column, color=group_by if group_by else None)
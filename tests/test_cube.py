@@ -0,0 +1,112 @@
+"""Tests pour le module de cubes pré-agrégés."""
+
+import pandas as pd
+import pytest
+
+from data_viz_app.cube import build_cube, dataset_fingerprint, get_cube
+from data_viz_app.visualizations import _prepare_data, create_chart
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "genre": ["pop", "pop", "rock", "rock", "jazz", "jazz"],
+        "explicit": [True, False, True, False, True, False],
+        "decade": ["90s", "00s", "90s", "90s", "00s", "00s"],
+        "popularity": [80, 90, 70, 60, 50, 40],
+    })
+
+
+@pytest.mark.parametrize("aggregation", ["sum", "mean", "count"])
+def test_query_matches_prepare_data(df, aggregation):
+    """Test que le cube donne le même résultat que les données brutes."""
+    cube = build_cube(df, "genre", "popularity", "explicit", ["decade"])
+    result = cube.query(aggregation)
+    expected = _prepare_data(df, "genre", "popularity", "explicit", aggregation)
+    pd.testing.assert_frame_equal(result, expected, check_dtype=False)
+
+
+def test_query_with_filters(df):
+    """Test filtre sur une dimension suggérée et sur group_by."""
+    cube = build_cube(df, "genre", "popularity", "explicit", ["decade"])
+    result = cube.query("max", {"decade": ["90s"], "explicit": [True]})
+    assert result["genre"].tolist() == ["pop", "rock"]
+    assert result["popularity"].tolist() == [80, 70]
+
+
+def test_cube_dimension_named_size():
+    """Test dimensions portant le nom d'une statistique (ex: size)."""
+    tips = pd.DataFrame({
+        "day": ["Sun", "Sun", "Sat", "Sat"],
+        "sex": ["F", "M", "F", "M"],
+        "size": [2, 3, 2, 4],
+        "tip": [1.0, 2.0, 3.0, 4.0],
+    })
+    cube = build_cube(tips, "day", "tip", "size", ["sex"])
+    expected = _prepare_data(tips, "day", "tip", "size", "sum")
+    pd.testing.assert_frame_equal(cube.query("sum"), expected, check_dtype=False)
+    result = build_cube(tips, "day", "tip", None, ["size"]).query("count", {"size": [2]})
+    assert result["tip"].tolist() == [1, 1]
+
+
+def test_query_unknown_filter(df):
+    """Test filtre sur une colonne hors du cube."""
+    cube = build_cube(df, "genre", "popularity")
+    with pytest.raises(ValueError, match="decade"):
+        cube.query("sum", {"decade": ["90s"]})
+
+
+def test_get_cube_cached(df):
+    """Test mise en cache par empreinte du dataset."""
+    config = {
+        "chart_type": "bar",
+        "x_column": "genre",
+        "y_column": "popularity",
+        "group_by": "null",
+        "filter_columns": ["decade", "inexistant"],
+    }
+    cube = get_cube(df, config)
+    assert cube.filter_columns == ["decade"]
+    assert get_cube(df.copy(), config) is cube
+    assert get_cube(df, {**config, "chart_type": "scatter"}) is None
+
+    modified = df.assign(popularity=df["popularity"] + 1)
+    assert dataset_fingerprint(modified) != dataset_fingerprint(df)
+    assert get_cube(modified, config) is not cube
+
+
+def test_get_cube_single_filter_column(df):
+    """Test filter_columns renvoyé par le LLM sous forme de chaîne."""
+    config = {
+        "chart_type": "bar",
+        "x_column": "genre",
+        "y_column": "popularity",
+        "filter_columns": "decade",
+    }
+    assert get_cube(df, config).filter_columns == ["decade"]
+
+
+def test_get_cube_too_large():
+    """Test repli sur les données brutes quand x est continu."""
+    df = pd.DataFrame({
+        "tempo": [float(i) for i in range(2000)],
+        "mode": [0, 1] * 1000,
+        "popularity": list(range(2000)),
+    })
+    config = {"chart_type": "line", "x_column": "tempo", "y_column": "popularity"}
+    assert get_cube(df, config) is None
+    assert get_cube(df, {**config, "x_column": "mode"}) is not None
+
+
+def test_create_chart_from_cube(df):
+    """Test création d'un graphique à partir d'une requête sur le cube."""
+    config = {
+        "chart_type": "bar",
+        "x_column": "genre",
+        "y_column": "popularity",
+        "group_by": None,
+        "aggregation": "mean",
+    }
+    data = build_cube(df, "genre", "popularity").query("sum")
+    fig = create_chart(df, config, title="Test", data=data)
+    assert sorted(fig.data[0].y) == [90, 130, 170]
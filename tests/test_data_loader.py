@@ -6,7 +6,12 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from data_viz_app.data_loader import get_column_summary, load_csv
+from data_viz_app.data_loader import (
+    format_memory_report,
+    get_column_summary,
+    load_csv,
+    optimize_dtypes,
+)
 
 
 def test_load_csv():
@@ -34,3 +39,39 @@ def test_get_column_summary():
     summary = get_column_summary(df)
     assert "genre" in summary
     assert "popularity" in summary
+
+
+def test_optimize_dtypes():
+    """Test conversion des colonnes en types compacts."""
+    df = pd.DataFrame({
+        "genre": ["pop", "rock"] * 50,
+        "name": [f"titre {i}" for i in range(100)],
+        "popularity": list(range(100)),
+        "energy": [0.5] * 100,
+        "explicit": pd.Series([True, False] * 50, dtype=object),
+    })
+    result = optimize_dtypes(df)
+    assert isinstance(result["genre"].dtype, pd.CategoricalDtype)
+    assert isinstance(result["name"].dtype, pd.StringDtype)
+    assert result["popularity"].dtype == "int8"
+    assert result["energy"].dtype == "float32"
+    assert result["explicit"].dtype == bool
+    assert result["name"].tolist() == df["name"].tolist()
+
+
+def test_optimize_dtypes_keeps_float_precision():
+    """Test qu'un flottant non représentable en float32 reste en float64."""
+    df = pd.DataFrame({"fare": [7.25, 71.2833, None]})
+    result = optimize_dtypes(df)
+    assert result["fare"].dtype == "float64"
+    assert result["fare"].tolist()[:2] == [7.25, 71.2833]
+
+
+def test_format_memory_report():
+    """Test rapport mémoire avant/après optimisation."""
+    df = pd.DataFrame({"genre": ["pop", "rock"] * 50})
+    assert format_memory_report(df) is None
+    result = optimize_dtypes(df)
+    report = result.attrs["memory_report"]
+    assert report["after"] < report["before"]
+    assert "Mémoire" in format_memory_report(result)